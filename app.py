@@ -1,15 +1,31 @@
+import functools
 import json
 import os
+import queue
 import sys
 import threading
+import time
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
 
 import tkinter as tk
 from tkinter import messagebox
 from tkinter import ttk
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson as _fast_json
+except ImportError:  # optional speedup; stdlib json also accepts bytes
+    _fast_json = json
+
+
+def _dumps(obj: Any) -> bytes:
+    # orjson already returns bytes; stdlib json returns str
+    data = _fast_json.dumps(obj)
+    return data if isinstance(data, bytes) else data.encode("utf-8")
 
 
 BG_COLOR = "#FDFDFD"
@@ -27,23 +43,97 @@ STATUS_SEEN_BG = "#E8F5E9"
 
 WINDOW_WIDTH = 500
 WINDOW_HEIGHT = 550
+HISTORY_ROWS = 16  # rows the history tree asks for; fewer may fit the window
 APP_TITLE = "The Grievance Log"
 
+# Column names as written by the app, followed by the lowercase variant
+# some sheet APIs return
+_TS_KEYS = ("Timestamp", "timestamp")
+_GRIEVANCE_KEYS = ("Grievance", "grievance")
+_STATUS_KEYS = ("Status", "status")
+
+
+def _make_session() -> requests.Session:
+    # One pooled session for the whole app so refresh/submit reuse the connection
+    session = requests.Session()
+    retry = Retry(total=2, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Accept-Encoding": "gzip, deflate",
+        "Accept": "application/json",
+        "User-Agent": "GrievanceLog/1.0",
+    })
+    # Default timeout for every call made through the session
+    session.request = functools.partial(session.request, timeout=15)
+    return session
+
+
+_SESSION = _make_session()
+
 
 def _safe_parse_dt(s: str):
+    if not s:
+        return None
+    # ISO first (what submit_grievance writes); normalize a UTC "Z" suffix
+    if s[-1] in "Zz":
+        s = s[:-1] + "+00:00"
     try:
-        # Try a few common formats; fall back to as-is ordering
-        # ISO first
-        return datetime.fromisoformat(s)
-    except Exception:
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%m/%d/%Y %H:%M:%S", "%d/%m/%Y %H:%M:%S"):
+        dt = datetime.fromisoformat(s)
+        # Keep everything naive local time so mixed rows stay comparable
+        if dt.tzinfo is not None:
+            dt = dt.astimezone().replace(tzinfo=None)
+    except ValueError:
+        dt = None
+    except OverflowError:
+        # astimezone() overflows for aware values at the edge of the range
+        return None
+    if dt is not None:
+        return dt
+    # Slower fallback only for sheet-edited dates like 09/22/2025 12:34:56
+    if "/" in s:
+        for fmt in ("%m/%d/%Y %H:%M:%S", "%d/%m/%Y %H:%M:%S"):
             try:
                 return datetime.strptime(s, fmt)
-            except Exception:
+            except ValueError:
                 continue
     return None
 
 
+def _pick_key(rows: List[Any], keys: Tuple[str, str]) -> str:
+    # The API uses one casing for every row, so decide once from the first
+    upper, lower = keys
+    first = rows[0] if rows else None
+    if isinstance(first, dict) and upper not in first and lower in first:
+        return lower
+    return upper
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ts_cached(s: str) -> datetime:
+    # Unknown/unparseable timestamps sort last
+    return _safe_parse_dt(s) or datetime.min
+
+
+@functools.lru_cache(maxsize=None)
+def _load_config() -> Dict[str, Any]:
+    # Determine base directory for config.json
+    # If running as a bundled executable, place config.json next to the EXE
+    if getattr(sys, "frozen", False):
+        base_dir = os.path.dirname(sys.executable)
+    else:
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+
+    config_path = os.path.join(base_dir, "config.json")
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            cfg = json.load(f)
+    except Exception:
+        return {}
+    return cfg if isinstance(cfg, dict) else {}
+
+
 class GrievanceApp(tk.Tk):
     def __init__(self) -> None:
         super().__init__()
@@ -60,6 +150,22 @@ class GrievanceApp(tk.Tk):
         # Config
         self.api_url = self._load_api_url()
 
+        # Two reused daemon threads for network I/O; being daemons, they never
+        # hold the process open after the window is closed
+        self._jobs: "queue.Queue[Callable[[], None]]" = queue.Queue()
+        for i in range(2):
+            threading.Thread(target=self._run_jobs, name=f"grievance-io-{i}", daemon=True).start()
+        self._fetch_inflight = False
+        self._fetch_pending = False
+        self._submit_inflight = False
+
+        # Row tags indexed by (idx & 1) | (seen << 1)
+        self._row_tags = (("even",), ("odd",), ("even", "status-seen"), ("odd", "status-seen"))
+
+        # Full history as (grievance, status) pairs; only a window of it is in the tree
+        self._model: List[Tuple[str, str]] = []
+        self._top = 0
+
         # UI
         self._build_ui()
 
@@ -119,23 +225,9 @@ class GrievanceApp(tk.Tk):
         if env_url:
             return env_url
 
-        # Determine base directory for config.json
-        # If running as a bundled executable, place config.json next to the EXE
-        if getattr(sys, "frozen", False):
-            base_dir = os.path.dirname(sys.executable)
-        else:
-            base_dir = os.path.dirname(os.path.abspath(__file__))
-
-        config_path = os.path.join(base_dir, "config.json")
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, "r", encoding="utf-8") as f:
-                    cfg = json.load(f)
-                url = str(cfg.get("SHEET_API_URL", "")).strip()
-                if url:
-                    return url
-            except Exception:
-                pass
+        url = str(_load_config().get("SHEET_API_URL", "")).strip()
+        if url:
+            return url
 
         # If we get here, we couldn't find a URL
         self.after(200, lambda: messagebox.showerror(
@@ -158,7 +250,9 @@ class GrievanceApp(tk.Tk):
 
         # Placeholder behavior
         self._placeholder_active = False
+        self._input_is_empty = True
         self.input_text.tag_configure("placeholder", foreground=TEXT_MUTED)
+        self.input_text.bind("<<Modified>>", self._on_text_modified)
         self._ensure_placeholder()
         self.input_text.bind("<FocusIn>", self._on_input_focus_in)
         self.input_text.bind("<FocusOut>", self._on_input_focus_out)
@@ -188,24 +282,45 @@ class GrievanceApp(tk.Tk):
         self.refresh_btn = ttk.Button(header, text="Refresh 🔄", command=self.fetch_and_display_grievances)
         self.refresh_btn.pack(side="right")
 
+        # Transient feedback (e.g. after copying) without a modal dialog; lives
+        # in the header so the history tree keeps its full height
+        self._status_lbl = ttk.Label(header, text="", foreground=STATUS_SEEN_FG)
+        self._status_lbl.pack(side="right", padx=(0, 8))
+        self._status_after_id = None
+
         columns = ("Grievance", "Status")
-        self.tree = ttk.Treeview(bottom, columns=columns, show="headings", height=16)
+        self.tree = ttk.Treeview(bottom, columns=columns, show="headings", height=HISTORY_ROWS)
         self.tree.heading("Grievance", text="Grievance")
         self.tree.heading("Status", text="Status")
         self.tree.column("Grievance", width=350, anchor="w", stretch=True)
         self.tree.column("Status", width=100, anchor="center", stretch=False)
 
-        vsb = ttk.Scrollbar(bottom, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=vsb.set)
+        # The scrollbar drives our own window over self._model, not the tree
+        self._vsb = ttk.Scrollbar(bottom, orient="vertical", command=self._on_scrollbar)
 
         self.tree.grid(row=1, column=0, sticky="nsew")
-        vsb.grid(row=1, column=1, sticky="ns")
+        self._vsb.grid(row=1, column=1, sticky="ns")
 
         # Treeview tags for zebra striping and status highlighting
         self.tree.tag_configure("odd", background=ROW_ODD)
         self.tree.tag_configure("even", background=ROW_EVEN)
         self.tree.tag_configure("status-seen", background=STATUS_SEEN_BG, foreground=STATUS_SEEN_FG)
         self.tree.bind("<Double-1>", self._on_tree_double_click)
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.tree.bind("<MouseWheel>", self._on_tree_wheel)
+        self.tree.bind("<Button-4>", self._on_tree_wheel)
+        self.tree.bind("<Button-5>", self._on_tree_wheel)
+
+        for key in ("<Up>", "<Down>", "<Prior>", "<Next>"):
+            self.tree.bind(key, self._on_tree_key)
+
+        # Pool of row items whose contents are swapped while scrolling, so the
+        # tree holds one screenful of items however long the history is.
+        # _on_tree_configure trims it to the rows that fit, so the Treeview
+        # never has hidden items to scroll to on its own.
+        self._slots = tuple(self.tree.insert("", "end", values=("", "")) for _ in range(HISTORY_ROWS))
+        self._measure_after_id = None
+        self.tree.bind("<Configure>", self._on_tree_configure)
 
         bottom.columnconfigure(0, weight=1)
         bottom.rowconfigure(1, weight=1)
@@ -217,56 +332,126 @@ class GrievanceApp(tk.Tk):
     def fetch_and_display_grievances(self) -> None:
         if not self.api_url:
             return
+        if self._fetch_inflight:
+            # Run once more after the current fetch so nothing is missed
+            self._fetch_pending = True
+            return
 
         self._set_refresh_enabled(False)
 
         def worker():
             try:
-                resp = requests.get(self.api_url, timeout=15)
+                resp = _SESSION.get(self.api_url)
                 resp.raise_for_status()
-                data = resp.json()
+                data = _fast_json.loads(resp.content)
                 if not isinstance(data, list):
                     data = []
             except Exception as e:
-                self.after(0, lambda: messagebox.showerror("Fetch Failed", f"Couldn't retrieve history.\n\n{e}"))
-                self.after(0, lambda: self._set_refresh_enabled(True))
+                self.after(0, self._on_fetch_fail, e)
                 return
 
             # Optional: sort by Timestamp desc if present
             try:
-                def sort_key(row: Dict[str, Any]):
-                    ts = row.get("Timestamp") or row.get("timestamp") or ""
-                    dt = _safe_parse_dt(str(ts))
-                    # Place unknown at the end
-                    return dt or datetime.min
-
-                data_sorted = sorted(data, key=sort_key, reverse=True)
+                ts_key = _pick_key(data, _TS_KEYS)
+                keys = [_parse_ts_cached(str(r.get(ts_key) or "")) for r in data]
+                if all(keys[i] >= keys[i + 1] for i in range(len(keys) - 1)):
+                    # Server already returned newest-first
+                    data_sorted = data
+                else:
+                    # Decorate once; -i keeps equal timestamps in server order and
+                    # stops the comparison from ever reaching the row dicts
+                    decorated = [(k, -i, r) for i, (k, r) in enumerate(zip(keys, data))]
+                    decorated.sort(reverse=True)
+                    data_sorted = [t[2] for t in decorated]
             except Exception:
                 data_sorted = data
 
-            self.after(0, lambda: self._populate_tree(data_sorted))
-            self.after(0, lambda: self._set_refresh_enabled(True))
+            self.after(0, self._on_fetch_done, data_sorted)
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._jobs.put(worker)
 
-    def _populate_tree(self, rows: List[Dict[str, Any]]) -> None:
-        self.tree.delete(*self.tree.get_children())
-        for idx, row in enumerate(rows):
-            grievance = str(row.get("Grievance") or row.get("grievance") or "").strip()
-            status = str(row.get("Status") or row.get("status") or "").strip()
+    def _run_jobs(self) -> None:
+        while True:
+            job = self._jobs.get()
+            try:
+                job()
+            except Exception:
+                # Workers report their own errors; keep the thread alive
+                pass
 
-            tags = ["even" if idx % 2 == 0 else "odd"]
-            status_lower = status.lower()
-            if "seen" in status_lower or "✅" in status:
-                tags.append("status-seen")
+    def _on_fetch_done(self, rows: List[Dict[str, Any]]) -> None:
+        self._populate_tree(rows)
+        self._set_refresh_enabled(True)
 
-            self.tree.insert("", "end", values=(grievance, status), tags=tags)
+    def _on_fetch_fail(self, exc: Exception) -> None:
+        self._set_refresh_enabled(True)
+        messagebox.showerror("Fetch Failed", f"Couldn't retrieve history.\n\n{exc}")
+
+    def _populate_tree(self, rows: List[Dict[str, Any]]) -> None:
+        g_key = _pick_key(rows, _GRIEVANCE_KEYS)
+        s_key = _pick_key(rows, _STATUS_KEYS)
+        new_rows: List[Tuple[str, str]] = []
+        append = new_rows.append
+        for row in rows:
+            get = row.get
+            append((str(get(g_key) or "").strip(), str(get(s_key) or "").strip()))
+        old_rows = self._model
+        if new_rows == old_rows:
+            return
+
+        # History is newest-first, so new submissions land at the front and
+        # the rows that did not change form a common suffix
+        common = 0
+        limit = min(len(old_rows), len(new_rows))
+        while common < limit and old_rows[-1 - common] == new_rows[-1 - common]:
+            common += 1
+
+        top = self._top
+        if top and common >= len(old_rows) - top:
+            # Everything from the viewport down is unchanged; shift the offset
+            # by the rows added above it so the same rows stay on screen
+            top += len(new_rows) - len(old_rows)
+        self._model = new_rows
+        # Rows may have moved under the selected slot even if top stays put
+        self.tree.selection_remove(self.tree.selection())
+        self._render_rows(top)
+
+    def _render_rows(self, top: int) -> None:
+        model = self._model
+        n = len(model)
+        visible = len(self._slots)
+        top = max(0, min(top, n - visible))
+        if top != self._top:
+            # Slots now show different rows, so a selection would point elsewhere
+            self.tree.selection_remove(self.tree.selection())
+        self._top = top
+
+        item = self.tree.item
+        row_tags = self._row_tags
+        for i, iid in enumerate(self._slots):
+            idx = top + i
+            if idx < n:
+                grievance, status = model[idx]
+                seen = "seen" in status.lower() or "\u2705" in status
+                item(iid, values=(grievance, status), tags=row_tags[(idx & 1) | (seen << 1)])
+            else:
+                item(iid, values=("", ""), tags=())
+
+        if n > visible:
+            self._vsb.set(top / n, (top + visible) / n)
+        else:
+            self._vsb.set(0.0, 1.0)
+        # Slot 0 must stay the first row on screen
+        self.tree.yview_moveto(0)
 
     def submit_grievance(self) -> None:
         if not self.api_url:
             messagebox.showerror("Missing API URL", "No API URL configured. Please set SHEET_API_URL or config.json.")
             return
 
+        if self._submit_inflight:
+            return
+
         # Ignore placeholder content
         text = self._get_input_text().strip()
         if not text:
@@ -274,7 +459,7 @@ class GrievanceApp(tk.Tk):
             return
 
         payload = {
-            "Timestamp": datetime.now().isoformat(timespec="seconds"),
+            "Timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
             "Grievance": text,
             "Status": "",  # left blank; can be updated in the sheet manually
         }
@@ -284,37 +469,61 @@ class GrievanceApp(tk.Tk):
 
         def worker():
             try:
-                resp = requests.post(self.api_url, json=payload, timeout=15)
+                resp = _SESSION.post(self.api_url, data=_dumps(payload), headers={"Content-Type": "application/json"})
                 resp.raise_for_status()
             except Exception as e:
-                self.after(0, lambda: messagebox.showerror("Submit Failed", f"Couldn't submit your thought.\n\n{e}"))
-                self.after(0, lambda: self._set_submit_enabled(True))
+                self.after(0, self._on_submit_fail, e)
                 return
 
-            self.after(0, lambda: messagebox.showinfo("Submitted", "Your thought has been logged."))
-            self.after(0, lambda: self.input_text.delete("1.0", "end"))
-            self.after(0, self.fetch_and_display_grievances)
-            self.after(0, lambda: self._set_submit_enabled(True))
+            self.after(0, self._on_submit_done)
+
+        self._jobs.put(worker)
 
-        threading.Thread(target=worker, daemon=True).start()
+    def _on_submit_done(self) -> None:
+        # Update state before the modal so the refresh isn't held up by it
+        self.input_text.delete("1.0", "end")
+        self.fetch_and_display_grievances()
+        self._set_submit_enabled(True)
+        messagebox.showinfo("Submitted", "Your thought has been logged.")
+
+    def _on_submit_fail(self, exc: Exception) -> None:
+        self._set_submit_enabled(True)
+        messagebox.showerror("Submit Failed", f"Couldn't submit your thought.\n\n{exc}")
 
     # -------- UI State helpers --------
     def _set_refresh_enabled(self, enabled: bool) -> None:
+        self._fetch_inflight = not enabled
         try:
             self.refresh_btn.configure(state=("normal" if enabled else "disabled"))
         except Exception:
             pass
+        if enabled and self._fetch_pending:
+            self._fetch_pending = False
+            self.fetch_and_display_grievances()
 
     def _set_submit_enabled(self, enabled: bool) -> None:
+        self._submit_inflight = not enabled
         try:
             self._submit_btn_ref.configure(state=("normal" if enabled else "disabled"))
         except Exception:
             pass
 
     # -------- Input helpers --------
+    def _is_empty(self) -> bool:
+        # Index/search queries avoid copying the whole buffer out of Tcl
+        if self.input_text.index("end-1c") == "1.0":
+            return True
+        return not self.input_text.search(r"\S", "1.0", "end", regexp=True)
+
+    def _on_text_modified(self, _event=None) -> None:
+        # <<Modified>> only fires again once the flag is reset
+        if not self.input_text.edit_modified():
+            return
+        self._input_is_empty = self._is_empty()
+        self.input_text.edit_modified(False)
+
     def _ensure_placeholder(self) -> None:
-        current = self.input_text.get("1.0", "end").strip()
-        if not current:
+        if self._is_empty():
             self._placeholder_active = True
             self.input_text.delete("1.0", "end")
             self.input_text.insert("1.0", "Type your thought here…", ("placeholder",))
@@ -330,34 +539,130 @@ class GrievanceApp(tk.Tk):
 
     def _on_input_focus_out(self, _event=None) -> None:
         # Reinstate placeholder if left empty
-        if not self.input_text.get("1.0", "end").strip():
+        if self._input_is_empty:
             self._ensure_placeholder()
 
     def _get_input_text(self) -> str:
-        text = self.input_text.get("1.0", "end")
-        # If placeholder is visible, treat as empty
-        if self._placeholder_active:
+        # If placeholder is visible, treat as empty without copying the buffer
+        if self._placeholder_active or self._is_empty():
             return ""
-        return text
+        return self.input_text.get("1.0", "end")
 
     def _submit_via_shortcut(self) -> None:
         self.submit_grievance()
 
     # -------- Tree interactions --------
+    def _on_scrollbar(self, action: str, *args: str) -> None:
+        if action == "moveto":
+            top = int(float(args[0]) * len(self._model))
+        elif action == "scroll":
+            step = int(args[0])
+            if args[1] == "pages":
+                step *= len(self._slots)
+            top = self._top + step
+        else:
+            return
+        self._render_rows(top)
+
+    def _on_tree_configure(self, _event=None) -> None:
+        # ttk lays the tree out in its idle redraw, which may not have run
+        # yet when <Configure> arrives, so measure afterwards
+        if self._measure_after_id is None:
+            self._measure_after_id = self.after_idle(self._measure_slots)
+
+    def _measure_slots(self, attempts: int = 20) -> None:
+        # The fixed window may clip the tree below HISTORY_ROWS; keep exactly
+        # as many slots as fully fit (less the 1px bottom border)
+        self._measure_after_id = None
+        self.tree.update_idletasks()
+        self.tree.yview_moveto(0)
+        box = self.tree.bbox(self._slots[0])
+        if not box:
+            if attempts > 1:
+                self._measure_after_id = self.after(50, self._measure_slots, attempts - 1)
+            return
+        _x, y, _w, row_h = box
+        fit = max(1, (self.tree.winfo_height() - y - 1) // row_h)
+        have = len(self._slots)
+        if fit == have:
+            return
+        if fit < have:
+            self.tree.delete(*self._slots[fit:])
+            self._slots = self._slots[:fit]
+        else:
+            self._slots += tuple(self.tree.insert("", "end", values=("", "")) for _ in range(fit - have))
+        self._render_rows(self._top)
+        # Confirm against the new layout; this settles once fit == have
+        self._measure_after_id = self.after_idle(self._measure_slots)
+
+    def _on_tree_key(self, event) -> str:
+        # Move through the model rather than the slots so keyboard users can
+        # reach rows outside the pool
+        n = len(self._model)
+        if not n:
+            return "break"
+        visible = len(self._slots)
+        focus = self.tree.focus()
+        current = self._top + self._slots.index(focus) if focus in self._slots else n
+        if current >= n:
+            # Nothing focused yet: the first keypress lands on the top row
+            idx = self._top
+        else:
+            step = {"Up": -1, "Down": 1, "Prior": -visible, "Next": visible}[event.keysym]
+            idx = max(0, min(current + step, n - 1))
+
+        top = self._top
+        if idx < top:
+            top = idx
+        elif idx >= top + visible:
+            top = idx - visible + 1
+        self._render_rows(top)
+
+        iid = self._slots[idx - self._top]
+        self.tree.selection_set(iid)
+        self.tree.focus(iid)
+        return "break"
+
+    def _on_tree_wheel(self, event) -> str:
+        # X11 reports the wheel as buttons 4/5; Windows/macOS use delta
+        if event.num == 4 or event.delta > 0:
+            self._render_rows(self._top - 3)
+        else:
+            self._render_rows(self._top + 3)
+        return "break"
+
+    def _on_tree_select(self, _event=None) -> None:
+        # Spare slots past the end of the history are blank; keep them
+        # from showing up as selected rows
+        n = len(self._model)
+        blank = [iid for iid in self.tree.selection() if self._top + self._slots.index(iid) >= n]
+        if blank:
+            self.tree.selection_remove(blank)
+
     def _on_tree_double_click(self, _event=None) -> None:
         sel = self.tree.selection()
-        if not sel:
+        if not sel or sel[0] not in self._slots:
             return
-        values = self.tree.item(sel[0], "values")
-        if not values:
+        idx = self._top + self._slots.index(sel[0])
+        if idx >= len(self._model):
             return
-        grievance = values[0]
+        grievance = self._model[idx][0]
         try:
             self.clipboard_clear()
             self.clipboard_append(grievance)
-            messagebox.showinfo("Copied", "Grievance text copied to clipboard.")
         except Exception:
-            pass
+            return
+        self._flash_status("Copied")
+
+    def _flash_status(self, text: str, ms: int = 1500) -> None:
+        if self._status_after_id is not None:
+            self.after_cancel(self._status_after_id)
+        self._status_lbl.configure(text=text)
+        self._status_after_id = self.after(ms, self._clear_status)
+
+    def _clear_status(self) -> None:
+        self._status_after_id = None
+        self._status_lbl.configure(text="")
 
 
 def main() -> None:
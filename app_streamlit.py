@@ -1,13 +1,47 @@
+import functools
 import json
 import os
 import sys
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 import streamlit as st
-
-
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson as _fast_json
+except ImportError:  # optional speedup; stdlib json also accepts bytes
+    _fast_json = json
+
+
+def _dumps(obj: Any) -> bytes:
+    # orjson already returns bytes; stdlib json returns str
+    data = _fast_json.dumps(obj)
+    return data if isinstance(data, bytes) else data.encode("utf-8")
+
+
+@st.cache_resource
+def _get_session() -> requests.Session:
+    # Cached across reruns so urllib3 keeps the connection to the API alive
+    session = requests.Session()
+    retry = Retry(total=2, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Accept-Encoding": "gzip, deflate",
+        "Accept": "application/json",
+        "User-Agent": "GrievanceLog/1.0",
+    })
+    # Default timeout for every call made through the session
+    session.request = functools.partial(session.request, timeout=20)
+    return session
+
+
+@st.cache_resource
 def _load_api_url() -> str:
     env_url = os.environ.get("SHEET_API_URL", "").strip()
     if env_url:
@@ -30,6 +64,7 @@ def _load_api_url() -> str:
     return ""
 
 
+@st.cache_resource
 def _load_images_cfg() -> Dict[str, Optional[str]]:
     """Load optional image paths/URLs from env or config.json.
 
@@ -77,6 +112,12 @@ def _load_images_cfg() -> Dict[str, Optional[str]]:
     # Default files from ./images if still not provided
     images_dir = os.path.join(base_dir, "images")
     if os.path.isdir(images_dir):
+        # One directory listing instead of a stat() per candidate name
+        try:
+            with os.scandir(images_dir) as it:
+                present = {e.name.lower(): e.path for e in it if e.is_file()}
+        except OSError:
+            present = {}
         candidates = {
             "HEADER_IMAGE": ["header.png", "header.jpg", "header.jpeg", "header.webp"],
             "SIDEBAR_IMAGE": ["sidebar.png", "sidebar.jpg", "sidebar.jpeg", "sidebar.webp"],
@@ -86,18 +127,19 @@ def _load_images_cfg() -> Dict[str, Optional[str]]:
             if result.get(key):
                 continue
             for name in names:
-                p = os.path.join(images_dir, name)
-                if os.path.isfile(p):
+                p = present.get(name)
+                if p:
                     result[key] = p
                     break
     return result
 
 
 # --- API functions (kept same interface as tkinter app logic) ---
+@st.cache_data(ttl=30, show_spinner=False)
 def fetch_grievances(api_url: str) -> List[Dict[str, Any]]:
-    resp = requests.get(api_url, timeout=20)
+    resp = _get_session().get(api_url)
     resp.raise_for_status()
-    data = resp.json()
+    data = _fast_json.loads(resp.content)
     if not isinstance(data, list):
         return []
     return data
@@ -105,130 +147,67 @@ def fetch_grievances(api_url: str) -> List[Dict[str, Any]]:
 
 def submit_grievance(api_url: str, text: str) -> None:
     payload = {
-        "Timestamp": datetime.now().isoformat(timespec="seconds"),
+        "Timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
         "Grievance": text,
         "Status": "",
     }
-    resp = requests.post(api_url, json=payload, timeout=20)
+    resp = _get_session().post(api_url, data=_dumps(payload), headers={"Content-Type": "application/json"})
     resp.raise_for_status()
 
 
-def _sort_rows_desc(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    def parse_ts(row):
-        ts = str(row.get("Timestamp") or row.get("timestamp") or "")
-        try:
-            return datetime.fromisoformat(ts)
-        except Exception:
-            return datetime.min
+def _pick_key(rows: List[Any], keys: Tuple[str, str]) -> str:
+    # The API uses one casing for every row, so decide once from the first
+    upper, lower = keys
+    first = rows[0] if rows else None
+    if isinstance(first, dict) and upper not in first and lower in first:
+        return lower
+    return upper
 
-    return sorted(rows, key=parse_ts, reverse=True)
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ts_cached(ts: str) -> datetime:
+    if ts[-1:] in ("Z", "z"):
+        ts = ts[:-1] + "+00:00"
+    try:
+        dt = datetime.fromisoformat(ts)
+        if dt.tzinfo is not None:
+            dt = dt.astimezone().replace(tzinfo=None)
+    except (ValueError, OverflowError):
+        # astimezone() overflows for aware values at the edge of the range
+        return datetime.min
+    return dt
+
+
+def _sort_rows_desc(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    ts_key = _pick_key(rows, ("Timestamp", "timestamp"))
+    keys = [_parse_ts_cached(str(r.get(ts_key) or "")) for r in rows]
+    if all(keys[i] >= keys[i + 1] for i in range(len(keys) - 1)):
+        # Server already returned newest-first
+        return rows
+
+    # Decorate once; -i keeps equal timestamps in server order and stops the
+    # comparison from ever reaching the row dicts
+    decorated = [(k, -i, r) for i, (k, r) in enumerate(zip(keys, rows))]
+    decorated.sort(reverse=True)
+    return [t[2] for t in decorated]
+
+
+@st.cache_data
+def _load_css() -> str:
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    css_path = os.path.join(base_dir, "static", "app.css")
+    try:
+        with open(css_path, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return ""
 
 
 def main():
     st.set_page_config(page_title="Jeremiahpaglu", layout="centered")
 
     # Inject custom CSS for light pink background and gentle accents
-    st.markdown(
-        """
-        <style>
-        /* Page background */
-        .stApp {
-            background-color: #FFEFF4; /* light pink */
-        }
-        /* Make ALL text black by default */
-        html, body, .stApp, .stMarkdown, .stText, .stWrite, .st-emotion-cache, .stExpander, 
-        h1, h2, h3, h4, h5, h6, p, label, span, div, code, pre, li, summary,
-        section[data-testid="stSidebar"], section[data-testid="stSidebar"] * {
-            color: #000000 !important;
-        }
-        /* Links also black */
-        a, a:visited, a:hover, a:active { color: #000000 !important; }
-        /* Text area text & placeholder black; bg white */
-        .stTextArea textarea {
-            background-color: #FFFFFF !important;
-            color: #000000 !important;
-            caret-color: #000000 !important;
-        }
-        .stTextArea textarea::placeholder { color: #000000 !important; }
-        /* Cards/expanders neutral background */
-        .stExpander, .stMarkdown { background-color: #FFFFFF !important; }
-        /* Primary button color with black text (purple) */
-        .stButton>button,
-        button[kind="primary"],
-        div[data-testid="stFormSubmitButton"] button,
-        div[data-testid="baseButton-primary"] {
-            background-color: #7C3AED !important; /* purple */
-            background-image: none !important;
-            border: 1px solid #7C3AED !important;
-            color: #000000 !important; /* keep text black as requested */
-            box-shadow: none !important;
-        }
-        .stButton>button:hover,
-        button[kind="primary"]:hover,
-        div[data-testid="stFormSubmitButton"] button:hover,
-        div[data-testid="baseButton-primary"]:hover,
-        .stButton>button:focus,
-        button[kind="primary"]:focus,
-        div[data-testid="stFormSubmitButton"] button:focus,
-        div[data-testid="baseButton-primary"]:focus,
-        .stButton>button:active,
-        button[kind="primary"]:active,
-        div[data-testid="stFormSubmitButton"] button:active,
-        div[data-testid="baseButton-primary"]:active {
-            background-color: #6D28D9 !important;
-            border-color: #6D28D9 !important;
-            color: #000000 !important;
-            box-shadow: none !important;
-        }
-
-        /* Sidebar image: auto-fill width */
-        section[data-testid="stSidebar"] img {
-            width: 100% !important;
-            max-width: 100% !important;
-            height: auto !important;
-            display: block !important;
-            object-fit: contain !important; /* change to cover if you prefer crop */
-        }
-
-        /* Sidebar buttons: same color as background (light pink) */
-        section[data-testid="stSidebar"] .stButton>button,
-        section[data-testid="stSidebar"] button[kind="primary"],
-        section[data-testid="stSidebar"] div[data-testid="stFormSubmitButton"] button,
-        section[data-testid="stSidebar"] div[data-testid="baseButton-primary"],
-        section[data-testid="stSidebar"] div[data-testid="baseButton-secondary"],
-        section[data-testid="stSidebar"] button {
-            background-color: #FFEFF4 !important;
-            border: 1px solid #FFEFF4 !important;
-            color: #000000 !important;
-            box-shadow: none !important;
-        }
-        section[data-testid="stSidebar"] .stButton>button:hover,
-        section[data-testid="stSidebar"] button[kind="primary"]:hover,
-        section[data-testid="stSidebar"] div[data-testid="stFormSubmitButton"] button:hover,
-        section[data-testid="stSidebar"] div[data-testid="baseButton-primary"]:hover,
-        section[data-testid="stSidebar"] div[data-testid="baseButton-secondary"]:hover,
-        section[data-testid="stSidebar"] button:hover,
-        section[data-testid="stSidebar"] .stButton>button:focus,
-        section[data-testid="stSidebar"] button[kind="primary"]:focus,
-        section[data-testid="stSidebar"] div[data-testid="stFormSubmitButton"] button:focus,
-        section[data-testid="stSidebar"] div[data-testid="baseButton-primary"]:focus,
-        section[data-testid="stSidebar"] div[data-testid="baseButton-secondary"]:focus,
-        section[data-testid="stSidebar"] button:focus,
-        section[data-testid="stSidebar"] .stButton>button:active,
-        section[data-testid="stSidebar"] button[kind="primary"]:active,
-        section[data-testid="stSidebar"] div[data-testid="stFormSubmitButton"] button:active,
-        section[data-testid="stSidebar"] div[data-testid="baseButton-primary"]:active,
-        section[data-testid="stSidebar"] div[data-testid="baseButton-secondary"]:active,
-        section[data-testid="stSidebar"] button:active {
-            background-color: #FFEFF4 !important; /* keep same as bg */
-            border-color: #FFEFF4 !important;
-            color: #000000 !important;
-            box-shadow: none !important;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(f"<style>{_load_css()}</style>", unsafe_allow_html=True)
 
     st.title("Why Bhakti hates me 😭😭")
 
@@ -261,7 +240,8 @@ def main():
                     st.error(f"Couldn't submit your thought.\n\n{e}")
                     st.stop()
                 st.success("Your thought has been logged.")
-                # Trigger a rerun to refresh history immediately
+                # Drop the cached history so the rerun shows the new entry
+                fetch_grievances.clear()
                 st.rerun()
 
     # History
@@ -269,6 +249,7 @@ def main():
     st.subheader("Do you even love me?🥺")
     refresh = st.button("Refresh 🔄")
     if refresh:
+        fetch_grievances.clear()
         st.rerun()
 
     try: